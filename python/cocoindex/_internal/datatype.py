@@ -1,5 +1,6 @@
 import collections
 import dataclasses
+import functools
 import inspect
 import types
 import typing
@@ -63,6 +64,54 @@ def is_record_type(t: Any) -> bool:
     )
 
 
+def _has_generated_init(t: type) -> bool:
+    """Whether ``t.__init__`` is the one generated by ``@dataclass`` for ``t`` itself.
+
+    ``@dataclass`` keeps a user-defined ``__init__`` (and skips generating one
+    with ``init=False``), in which case the class may inherit or define an
+    ``__init__`` unrelated to its fields. Generated methods are compiled from
+    source text, so their code has no backing file.
+    """
+    init = t.__dict__.get("__init__")
+    code = getattr(init, "__code__", None)
+    return code is not None and code.co_filename == "<string>"
+
+
+def _dataclass_init_fields(t: type) -> list[tuple[str, Any]]:
+    """
+    Return ``(name, default)`` for each ``__init__`` parameter of a dataclass.
+
+    Reads the dataclass fields directly instead of building an
+    ``inspect.Signature``. Falls back to ``inspect.signature`` for exotic cases
+    (custom or inherited ``__init__``, ``kw_only`` fields, ``default_factory``,
+    ``ClassVar`` / ``InitVar`` pseudo-fields), whose parameters or their order
+    can't be reproduced from the fields alone.
+    """
+    fields = dataclasses.fields(t)
+    if (
+        not _has_generated_init(t)
+        or len(fields) != len(getattr(t, "__dataclass_fields__"))
+        or any(
+            f.kw_only is True or f.default_factory is not dataclasses.MISSING
+            for f in fields
+        )
+    ):
+        return [
+            (name, parameter.default)
+            for name, parameter in inspect.signature(t).parameters.items()
+        ]
+    return [
+        (
+            f.name,
+            f.default
+            if f.default is not dataclasses.MISSING
+            else inspect.Parameter.empty,
+        )
+        for f in fields
+        if f.init
+    ]
+
+
 class DtypeRegistry:
     """
     Registry for NumPy dtypes used in CocoIndex.
@@ -129,12 +178,11 @@ class RecordType(NamedTuple):
     def fields(self) -> Iterator[RecordFieldInfo]:
         type_hints = get_type_hints(self.record_type, include_extras=True)
         if dataclasses.is_dataclass(self.record_type):
-            parameters = inspect.signature(self.record_type).parameters
-            for name, parameter in parameters.items():
+            for name, default_value in _dataclass_init_fields(self.record_type):
                 yield RecordFieldInfo(
                     name=name,
                     type_hint=type_hints.get(name, Any),
-                    default_value=parameter.default,
+                    default_value=default_value,
                     description=None,
                 )
         elif is_namedtuple_type(self.record_type):
@@ -167,7 +215,7 @@ class UnionType(NamedTuple):
     Any union type, e.g. T1 | T2 | ..., etc.
     """
 
-    variant_types: list[Any]
+    variant_types: tuple[Any, ...]
 
 
 class MappingType(NamedTuple):
@@ -205,8 +253,44 @@ class DataTypeInfo(NamedTuple):
 def analyze_type_info(t: Any, *, nullable: bool = False) -> DataTypeInfo:
     """
     Analyze a Python type annotation and extract CocoIndex-specific type information.
+
+    Results are cached, as the same annotations are analyzed repeatedly while
+    building schemas. Annotations that aren't hashable (e.g. ``Annotated`` with
+    unhashable metadata) are analyzed without caching.
+    """
+    try:
+        return _analyze_type_info_cached(t, _type_structure_key(t), nullable)
+    except TypeError:
+        return _analyze_type_info(t, nullable)
+
+
+def _type_structure_key(t: Any) -> tuple[Any, tuple[Any, ...]]:
+    """
+    The origin and type arguments of ``t``, recursively, as nested tuples.
+
+    Some distinct annotations compare equal: unions regardless of member order
+    (``int | str == str | int``) and regardless of spelling
+    (``int | str == Union[int, str]``), while the analysis preserves both.
+    Keying the cache on this structure as well keeps them (also nested ones)
+    apart.
     """
+    return (
+        typing.get_origin(t),
+        tuple(
+            _type_structure_key(arg) if typing.get_args(arg) else arg
+            for arg in typing.get_args(t)
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_type_info_cached(
+    t: Any, _structure_key: tuple[Any, tuple[Any, ...]], nullable: bool
+) -> DataTypeInfo:
+    return _analyze_type_info(t, nullable)
 
+
+def _analyze_type_info(t: Any, nullable: bool) -> DataTypeInfo:
     annotations: tuple[Any, ...] = ()
     base_type = None
     type_args: tuple[Any, ...] = ()
@@ -261,7 +345,7 @@ def analyze_type_info(t: Any, *, nullable: bool = False) -> DataTypeInfo:
                 nullable=nullable or len(non_none_types) < len(type_args),
             )
 
-        variant = UnionType(variant_types=non_none_types)
+        variant = UnionType(variant_types=tuple(non_none_types))
     else:
         variant = LeafType()
 
@@ -281,6 +365,21 @@ def analyze_type_info(t: Any, *, nullable: bool = False) -> DataTypeInfo:
 _CheckFn = Callable[[Any, str], None]
 
 
+def _is_plain_class(tp: Any) -> bool:
+    """Whether ``isinstance(value, tp)`` is a valid, complete check for ``tp``.
+
+    Excludes ``Any`` (a class since Python 3.11, but rejected by
+    ``isinstance``), protocols, TypedDicts, and parameterized generics.
+    """
+    return (
+        isinstance(tp, type)
+        and tp is not Any
+        and typing.get_origin(tp) is None
+        and not getattr(tp, "_is_protocol", False)
+        and not typing.is_typeddict(tp)
+    )
+
+
 def _build_check_fn(tp: Any) -> _CheckFn:
     """
     Build a validation closure for the given type annotation.
@@ -308,7 +407,21 @@ def _build_check_fn(tp: Any) -> _CheckFn:
 
     # Union: str | int, str | None, etc.
     if origin in (types.UnionType, typing.Union):
-        sub_fns = [_build_check_fn(a) for a in args]
+        if all(_is_plain_class(a) for a in args):
+            # Union of plain classes (incl. NoneType): one isinstance call
+            # against all variants instead of trying each check in turn.
+            variant_types = tuple(args)
+
+            def check_simple_union(value: Any, path: str) -> None:
+                if not isinstance(value, variant_types):
+                    loc = f" at {path}" if path else ""
+                    raise TypeError(
+                        f"expected {tp}{loc}, got {type(value).__name__}: {value!r}"
+                    )
+
+            return check_simple_union
+
+        sub_fns = tuple(_build_check_fn(a) for a in args)
 
         def check_union(value: Any, path: str) -> None:
             for fn in sub_fns:
@@ -352,7 +465,7 @@ def _build_check_fn(tp: Any) -> _CheckFn:
 
         if args:
             # Fixed-length: tuple[X, Y, ...]
-            elem_fns = [_build_check_fn(a) for a in args]
+            elem_fns = tuple(_build_check_fn(a) for a in args)
             expected_len = len(args)
 
             def check_fixed_tuple(value: Any, path: str) -> None:
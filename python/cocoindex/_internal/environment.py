@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import os
 from inspect import isasyncgenfunction
 import threading
 import warnings
@@ -35,6 +36,26 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop for a loop thread we own.
+
+    Uses uvloop when opted in with ``COCOINDEX_USE_UVLOOP=1``: its libuv-based
+    loop makes the cross-thread scheduling and callbacks these loops mostly do
+    considerably cheaper. It's never picked up just because it happens to be
+    installed. Loops passed in by the caller are used as-is.
+    """
+    if os.environ.get("COCOINDEX_USE_UVLOOP") != "1":
+        return asyncio.new_event_loop()
+    try:
+        import uvloop  # type: ignore[import-not-found, unused-ignore]
+    except ImportError as e:
+        raise ImportError(
+            "COCOINDEX_USE_UVLOOP=1 requires uvloop; "
+            "install it with `pip install 'cocoindex[uvloop]'`."
+        ) from e
+    return uvloop.new_event_loop()  # type: ignore[no-any-return, unused-ignore]
+
+
 class _LoopRunner:
     """
     Owns an event loop and optionally a daemon thread running it.
@@ -78,7 +99,7 @@ class _LoopRunner:
 
     @classmethod
     def create_new_running(cls) -> "_LoopRunner":
-        runner = cls(asyncio.new_event_loop())
+        runner = cls(_new_event_loop())
         runner.ensure_running()
         return runner
 
@@ -491,6 +512,11 @@ def default_env_loop() -> asyncio.AbstractEventLoop:
     """
     global _bg_loop_runner  # pylint: disable=global-statement
 
+    # Fast path: once the loop is running, a plain read is enough.
+    runner = _bg_loop_runner
+    if runner is not None and not runner.loop.is_closed():
+        return runner.loop
+
     with _bg_loop_lock:
         if _bg_loop_runner is not None and not _bg_loop_runner.loop.is_closed():
             return _bg_loop_runner.loop
@@ -557,9 +583,7 @@ atexit.register(_shutdown_at_exit)
 
 
 def start_sync() -> Environment:
-    loop = default_env_loop()
-    fut = asyncio.run_coroutine_threadsafe(_default_env.start(), loop)
-    return fut.result()
+    return _default_env._get_env_sync()
 
 
 def stop_sync() -> None:
@@ -595,7 +619,9 @@ def get_event_loop_or_default() -> asyncio.AbstractEventLoop:
     Returns the currently running event loop if called from an async context.
     Otherwise, returns the shared background loop (from default_env_loop()).
     """
-    try:
-        return asyncio.get_running_loop()
-    except RuntimeError:
-        return default_env_loop()
+    # `_get_running_loop()` returns None instead of raising, which keeps the
+    # common sync-caller path free of exception setup.
+    loop = asyncio._get_running_loop()
+    if loop is not None:
+        return loop
+    return default_env_loop()
@@ -59,6 +59,7 @@ from .runner import Runner
 from .runner import in_subprocess as _in_subprocess
 from .serde import (
     DeserializeFn,
+    get_deserialize_fn,
     make_deserialize_fn,
     qualified_name,
     unwrap_element_type,
@@ -2254,25 +2255,39 @@ def fn_ret_deserializer(fn: typing.Any) -> DeserializeFn:
 
     Zero upfront cost — all work is deferred to the first call.
     For ``@coco.fn``-decorated functions the pre-built ``DeserializeFn`` is reused.
-    For plain functions the return-type annotation is inspected at call time.
+    For plain functions the return-type annotation is inspected on the first call;
+    the resulting ``DeserializeFn`` is kept for later calls and shared with other
+    functions returning the same hint.
     """
     # Unwrap bound methods to get the underlying Function object.
     if isinstance(fn, (_BoundSyncMethod, _BoundAsyncMethod)):
         fn = fn._func
     fn_label = qualified_name(fn)
 
-    def _deserialize(data: bytes | memoryview) -> typing.Any:
+    resolved: DeserializeFn | None = None
+
+    def _resolve() -> DeserializeFn:
         cached: DeserializeFn | None = getattr(
             fn, "_resolved_return_deserializer", None
         )
         if cached is not None:
-            return cached(data)
+            return cached
         try:
             hint = typing.get_type_hints(fn).get("return", typing.Any)
         except Exception:
             hint = typing.Any
-        return make_deserialize_fn(hint, source_label=f"return type of {fn_label}()")(
-            data
-        )
+        source_label = f"return type of {fn_label}()"
+        try:
+            # Reuse the msgspec Decoder built for the same return type.
+            return get_deserialize_fn(hint, source_label)
+        except TypeError:
+            # Unhashable type hint (e.g. `Annotated` with unhashable metadata).
+            return make_deserialize_fn(hint, source_label=source_label)
+
+    def _deserialize(data: bytes | memoryview) -> typing.Any:
+        nonlocal resolved
+        if resolved is None:
+            resolved = _resolve()
+        return resolved(data)
 
     return _deserialize
@@ -38,6 +38,11 @@ class _MemoFns(typing.NamedTuple):
 
 _memo_fns: dict[type, _MemoFns] = {}
 
+# Exact types that canonicalize to themselves.
+_PRIMITIVE_TYPES: frozenset[type] = frozenset(
+    {type(None), bool, int, float, str, bytes, core.Fingerprint}
+)
+
 
 class StateFnEntry(typing.NamedTuple):
     """A state method paired with a deserializer for its ``prev_state`` parameter.
@@ -128,6 +133,18 @@ def _is_pydantic_model(obj: object) -> bool:
     return hasattr(obj, "__pydantic_fields__") and not isinstance(obj, type)  # type: ignore[attr-defined]
 
 
+_dataclass_field_names_cache: dict[type, tuple[str, ...]] = {}
+
+
+def _dataclass_field_names(typ: type) -> tuple[str, ...]:
+    """Field names of a dataclass type, in definition order (computed once per type)."""
+    names = _dataclass_field_names_cache.get(typ)
+    if names is None:
+        names = tuple(field.name for field in dataclasses.fields(typ))
+        _dataclass_field_names_cache[typ] = names
+    return names
+
+
 def _canonicalize_dataclass(
     obj: object,
     _seen: dict[int, int],
@@ -139,14 +156,13 @@ def _canonicalize_dataclass(
     Format: ("dataclass", module, qualname, ((field_name, value), ...))
     """
     typ = type(obj)
-    fields = dataclasses.fields(obj)  # type: ignore[arg-type]
     return (
         "dataclass",
         canonical_module_name(typ),
         typ.__qualname__,
         tuple(
-            (field.name, _canonicalize(getattr(obj, field.name), _seen, state_methods))
-            for field in fields
+            (name, _canonicalize(getattr(obj, name), _seen, state_methods))
+            for name in _dataclass_field_names(typ)
         ),
     )
 
@@ -270,13 +286,16 @@ def _canonicalize(
     _seen: dict[int, int] | None,
     state_methods: list[StateFnEntry],
 ) -> Fingerprintable:
+    # Fast path for the common leaf case: one set lookup instead of the
+    # isinstance chain below.
+    if type(obj) in _PRIMITIVE_TYPES:
+        return obj  # type: ignore[return-value]
+
     # 0) Cycle / shared-reference tracking for containers
     if _seen is None:
         _seen = {}
 
-    # 1) Primitives
-    if obj is None:
-        return None
+    # 1) Primitives (subclasses of primitive types)
     if isinstance(obj, (bool, int, float, str, bytes, core.Fingerprint)):
         # bool is a subclass of int; returning as-is preserves bools correctly.
         return obj
@@ -330,6 +349,10 @@ def _canonicalize(
 
     # 4) Containers
     if isinstance(obj, typing.Sequence):
+        # Sequences of plain primitives (token ids, float vectors, ...) are
+        # already canonical element-wise; skip the per-element recursion.
+        if all(type(e) in _PRIMITIVE_TYPES for e in obj):
+            return ("seq", tuple(obj))
         return ("seq", tuple(_canonicalize(e, _seen, state_methods) for e in obj))
 
     if isinstance(obj, typing.Mapping):
@@ -258,7 +258,8 @@ def _validate_name(value: str, label: str) -> str:
 def _vector_to_bytes(vector: list[float] | np.ndarray) -> bytes:  # type: ignore[type-arg]
     """Pack a vector into little-endian float32 bytes for Valkey HASH storage."""
     if isinstance(vector, np.ndarray):
-        return vector.astype(np.float32).tobytes()
+        # No intermediate copy when the array is already little-endian float32.
+        return np.asarray(vector, dtype="<f4").tobytes()
     return struct.pack(f"<{len(vector)}f", *vector)
 
 
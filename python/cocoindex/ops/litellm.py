@@ -55,6 +55,26 @@ _RETRYABLE_TRANSPORT_ERROR_CLASS_NAMES = frozenset(
 )
 
 
+# Default output dimensions of well-known embedding models, so the vector
+# schema can be reported without a probe request. Only exact model names are
+# listed: anything routed elsewhere (custom deployments, proxies) is probed.
+_KNOWN_EMBEDDING_DIMS: dict[str, int] = {
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "openai/text-embedding-ada-002": 1536,
+    "openai/text-embedding-3-small": 1536,
+    "openai/text-embedding-3-large": 3072,
+}
+
+# Models known to honor the ``dimensions`` argument. Other providers may drop
+# it (``drop_params=True``) and return their native size, so for those the
+# dimension is probed rather than taken from the argument.
+_MODELS_HONORING_DIMENSIONS: frozenset[str] = frozenset(
+    model for model in _KNOWN_EMBEDDING_DIMS if "text-embedding-3-" in model
+)
+
+
 def _message_indicates_non_retryable_credentials_error(message: str) -> bool:
     normalized = message.lower()
     if any(
@@ -231,11 +251,25 @@ class LiteLLMEmbedder(_schema.VectorSchemaProvider):
     async def _get_dim(self) -> int:
         """Get embedding dimension, caching the result.
 
-        Embeds a short test text to determine the dimension since LiteLLM
-        does not provide a dedicated API for querying embedding dimensions.
+        Uses a known model default, or an explicit ``dimensions`` argument for
+        models known to honor it, when available. Otherwise embeds a short test
+        text to determine the dimension, since LiteLLM does not provide a
+        dedicated API for querying embedding dimensions.
         """
         if self._dim is not None:
             return self._dim
+        known_dim = _KNOWN_EMBEDDING_DIMS.get(self._model)
+        if known_dim is not None and "api_base" not in self._kwargs:
+            dimensions = self._kwargs.get("dimensions")
+            if dimensions is None:
+                self._dim = known_dim
+                return self._dim
+            if (
+                isinstance(dimensions, int)
+                and self._model in _MODELS_HONORING_DIMENSIONS
+            ):
+                self._dim = dimensions
+                return self._dim
         async with self._get_lock():
             if self._dim is not None:
                 return self._dim
@@ -282,9 +316,11 @@ class LiteLLMEmbedder(_schema.VectorSchemaProvider):
             if not _is_global_litellm_error(e):
                 raise coco.RetryWithSmallerBatch() from e
             raise
-        return [
-            _np.array(item["embedding"], dtype=_np.float32) for item in response.data
-        ]
+        # Convert the whole batch in one pass; rows are views into one buffer.
+        embeddings = _np.asarray(
+            [item["embedding"] for item in response.data], dtype=_np.float32
+        )
+        return list(embeddings)
 
     @coco.fn(memo=True, version=1, logic_tracking="self")
     async def embed(
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 __all__ = ["SentenceTransformerEmbedder"]
 
+import logging as _logging
 import threading as _threading
 import typing as _typing
+import weakref as _weakref
 from typing import Any as _Any
 
 import numpy as _np
@@ -21,6 +23,10 @@ from cocoindex.resources import schema as _schema
 if _typing.TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+_logger = _logging.getLogger(__name__)
+
+_Precision = _typing.Literal["float32", "float16", "bfloat16"]
+
 
 def _is_oom_error(error: BaseException) -> bool:
     """Whether ``error`` is an accelerator/host out-of-memory failure.
@@ -50,6 +56,68 @@ def _empty_accelerator_cache() -> None:
         pass
 
 
+# (model_name_or_path, device, trust_remote_code, precision, max_seq_length)
+_ModelKey = tuple[str, str | None, bool, _Precision, int | None]
+
+# Loaded models shared across embedder instances, so that embedders created
+# separately for the same model (e.g. in different apps) don't each hold a
+# copy in (V)RAM. Entries go away once no embedder references the model.
+_loaded_models: _weakref.WeakValueDictionary[_ModelKey, SentenceTransformer] = (
+    _weakref.WeakValueDictionary()
+)
+# Guards `_key_locks`. Each key gets its own lock, so loading one model
+# doesn't block loads of unrelated ones.
+_key_locks_lock = _threading.Lock()
+_key_locks: dict[_ModelKey, _threading.Lock] = {}
+
+
+def _load_model(key: _ModelKey) -> SentenceTransformer:
+    model = _loaded_models.get(key)
+    if model is not None:
+        return model
+    with _key_locks_lock:
+        key_lock = _key_locks.setdefault(key, _threading.Lock())
+    with key_lock:
+        model = _loaded_models.get(key)
+        if model is None:
+            model = _create_model(key)
+            _loaded_models[key] = model
+        with _key_locks_lock:
+            _key_locks.pop(key, None)
+        return model
+
+
+def _create_model(key: _ModelKey) -> SentenceTransformer:
+    from sentence_transformers import SentenceTransformer
+
+    model_name_or_path, device, trust_remote_code, precision, max_seq_length = key
+    model = SentenceTransformer(
+        model_name_or_path,
+        device=device,
+        trust_remote_code=trust_remote_code,
+    )
+    # Reduced precision only pays off on accelerators; CPU kernels for
+    # half types are slow or missing.
+    if model.device.type != "cpu":
+        if precision == "float16":
+            model.half()
+        elif precision == "bfloat16":
+            model.bfloat16()
+    if max_seq_length is not None:
+        model.max_seq_length = max_seq_length
+    # transformers silently falls back to the pure-Python tokenizer when
+    # no Rust ("fast") one is available for the model, which makes
+    # tokenization an order of magnitude slower.
+    if not getattr(model.tokenizer, "is_fast", True):
+        _logger.warning(
+            "SentenceTransformer model %s uses a slow (pure-Python) tokenizer; "
+            "tokenization may dominate embedding time. Install `tokenizers` or "
+            "use a model that ships a fast tokenizer.",
+            model_name_or_path,
+        )
+    return model
+
+
 class SentenceTransformerEmbedder(_schema.VectorSchemaProvider):
     """Wrapper for SentenceTransformer models that implements VectorSchemaProvider.
 
@@ -63,6 +131,16 @@ class SentenceTransformerEmbedder(_schema.VectorSchemaProvider):
             Defaults to ``None`` to let SentenceTransformer auto-detect.
         trust_remote_code: Whether to allow loading models with custom code
             from the HuggingFace Hub (e.g., Jina models with custom pooling).
+        precision: Floating-point precision for model weights on an accelerator
+            (``"float32"``, ``"float16"`` or ``"bfloat16"``). Half precision
+            roughly halves memory traffic and speeds up inference on GPUs; it
+            is ignored when the model runs on CPU. Embeddings are always
+            returned as float32. Defaults to ``"float32"``.
+        max_seq_length: Maximum number of tokens per input; longer inputs are
+            truncated. Lowering it below the model's default speeds up
+            embedding of long texts (attention cost grows quadratically with
+            length) at the cost of ignoring their tail. Defaults to ``None``
+            to keep the model's own limit.
 
     Example:
         >>> from cocoindex.ops.sentence_transformers import SentenceTransformerEmbedder
@@ -83,41 +161,64 @@ class SentenceTransformerEmbedder(_schema.VectorSchemaProvider):
         *,
         device: str | None = None,
         trust_remote_code: bool = False,
+        precision: _Precision = "float32",
+        max_seq_length: int | None = None,
     ) -> None:
         """Initialize the SentenceTransformer embedder."""
+        if precision not in _typing.get_args(_Precision):
+            raise ValueError(
+                f"Unsupported precision {precision!r}; "
+                f"expected one of {_typing.get_args(_Precision)}"
+            )
+        if max_seq_length is not None and (
+            isinstance(max_seq_length, bool)
+            or not isinstance(max_seq_length, int)
+            or max_seq_length <= 0
+        ):
+            raise ValueError(
+                f"max_seq_length must be a positive int or None, got {max_seq_length!r}"
+            )
         self._model_name_or_path = model_name_or_path
         self._device = device
         self._trust_remote_code = trust_remote_code
+        self._precision: _Precision = precision
+        self._max_seq_length = max_seq_length
         self._model: SentenceTransformer | None = None
-        self._lock = _threading.Lock()
+        self._vector_schema: _schema.VectorSchema | None = None
 
     def __getstate__(self) -> dict[str, _Any]:
         return {
             "model_name_or_path": self._model_name_or_path,
             "device": self._device,
             "trust_remote_code": self._trust_remote_code,
+            "precision": self._precision,
+            "max_seq_length": self._max_seq_length,
         }
 
     def __setstate__(self, state: dict[str, _Any]) -> None:
         self._model_name_or_path = state["model_name_or_path"]
         self._device = state["device"]
         self._trust_remote_code = state["trust_remote_code"]
+        self._precision = state.get("precision", "float32")
+        self._max_seq_length = state.get("max_seq_length")
         self._model = None
-        self._lock = _threading.Lock()
+        self._vector_schema = None
 
     def _get_model(self) -> SentenceTransformer:
-        """Lazy-load the model (thread-safe)."""
-        if self._model is None:
-            with self._lock:
-                if self._model is None:
-                    from sentence_transformers import SentenceTransformer
-
-                    self._model = SentenceTransformer(
-                        self._model_name_or_path,
-                        device=self._device,
-                        trust_remote_code=self._trust_remote_code,
-                    )
-        return self._model
+        """Lazy-load the model (thread-safe), sharing it with other embedders
+        configured the same way."""
+        model = self._model
+        if model is None:
+            model = self._model = _load_model(
+                (
+                    self._model_name_or_path,
+                    self._device,
+                    self._trust_remote_code,
+                    self._precision,
+                    self._max_seq_length,
+                )
+            )
+        return model
 
     @coco.fn.as_async(batching=True, runner=coco.GPU, max_batch_size=64)
     def _embed(
@@ -162,7 +263,9 @@ class SentenceTransformerEmbedder(_schema.VectorSchemaProvider):
                 _empty_accelerator_cache()
                 raise coco.RetryWithSmallerBatch() from e
             raise
-        return list(embeddings)
+        # Half-precision models produce half-precision outputs; keep the
+        # float32 contract advertised by `__coco_vector_schema__`.
+        return list(embeddings.astype(_np.float32, copy=False))
 
     @coco.fn(memo=True, version=1, logic_tracking="self")
     async def embed(
@@ -199,8 +302,15 @@ class SentenceTransformerEmbedder(_schema.VectorSchemaProvider):
         Raises:
             RuntimeError: If the model's embedding dimension cannot be determined.
         """
-        dim = await self.dimension()
-        return _schema.VectorSchema(dtype=_np.dtype(_np.float32), size=dim)
+        # Connectors ask for the schema of every vector column they declare;
+        # it's constant per embedder, so only resolve it once.
+        schema = self._vector_schema
+        if schema is None:
+            dim = await self.dimension()
+            schema = self._vector_schema = _schema.VectorSchema(
+                dtype=_np.dtype(_np.float32), size=dim
+            )
+        return schema
 
     @coco.fn.as_async(runner=coco.GPU, memo=True)
     def dimension(self) -> int:
@@ -221,4 +331,16 @@ class SentenceTransformerEmbedder(_schema.VectorSchemaProvider):
         return int(dim)
 
     def __coco_memo_key__(self) -> object:
-        return (self._model_name_or_path, self._device, self._trust_remote_code)
+        key: tuple[object, ...] = (
+            self._model_name_or_path,
+            self._device,
+            self._trust_remote_code,
+        )
+        # Options are only part of the key when not at their defaults, so
+        # memos recorded before they existed stay valid for embedders that
+        # don't use them.
+        if self._precision != "float32":
+            key += (self._precision,)
+        if self._max_seq_length is not None:
+            key += (self._max_seq_length,)
+        return key
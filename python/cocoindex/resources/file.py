@@ -12,15 +12,19 @@ __all__ = [
 ]
 
 import codecs as _codecs
+from collections.abc import Sequence as _Sequence
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 from datetime import datetime as _datetime
 from pathlib import PurePath as _PurePath
 from typing import (
+    Any as _Any,
     Generic as _Generic,
     NamedTuple as _NamedTuple,
     Protocol as _Protocol,
     Self as _Self,
     TypeVar as _TypeVar,
+    cast as _cast,
+    overload as _overload,
 )
 
 from cocoindex._internal import core as _core
@@ -35,6 +39,7 @@ from cocoindex.connectorkits.fingerprint import fingerprint_bytes as _fingerprin
 
 # Type variable for the resolved path type (e.g., pathlib.Path for local filesystem)
 ResolvedPathT = _TypeVar("ResolvedPathT")
+_FilePathT = _TypeVar("_FilePathT", bound="FilePath[_Any]")
 
 
 class FileMetadata(_NamedTuple):
@@ -195,10 +200,19 @@ class FileLike(_ABC, _Generic[ResolvedPathT]):
         if current_mtime == prev_mtime:
             return _MemoStateOutcome(state=prev_state, memo_valid=True)
 
+        had_content = self._cached_content is not None
         fp = await self.content_fingerprint()
+        memo_valid = fp == prev_fp
+        if memo_valid and not had_content:
+            # Content was read only to be fingerprinted and is unchanged, so
+            # the memoized result is reused and the content usually isn't
+            # needed. Trade-off: rather than keeping the whole file alive for
+            # the rest of the run, a later read() (e.g. by a caller outside
+            # the memoized function) fetches it from the backend again.
+            self._cached_content = None
         return _MemoStateOutcome(
             state=(current_mtime, fp),
-            memo_valid=(fp == prev_fp),
+            memo_valid=memo_valid,
         )
 
 
@@ -279,13 +293,17 @@ class PatternFilePathMatcher(FilePathMatcher):
         return self._matcher.is_file_included(path.as_posix())
 
 
-_BOM_ENCODINGS = [
-    (_codecs.BOM_UTF32_LE, "utf-32-le"),
-    (_codecs.BOM_UTF32_BE, "utf-32-be"),
-    (_codecs.BOM_UTF16_LE, "utf-16-le"),
-    (_codecs.BOM_UTF16_BE, "utf-16-be"),
-    (_codecs.BOM_UTF8, "utf-8-sig"),
-]
+# BOM -> encoding, grouped by BOM length. Longer BOMs are checked first, since
+# the UTF-32-LE BOM starts with the UTF-16-LE one.
+_BOM_ENCODINGS_BY_LENGTH: tuple[tuple[int, dict[bytes, str]], ...] = (
+    (4, {_codecs.BOM_UTF32_LE: "utf-32-le", _codecs.BOM_UTF32_BE: "utf-32-be"}),
+    (3, {_codecs.BOM_UTF8: "utf-8-sig"}),
+    (2, {_codecs.BOM_UTF16_LE: "utf-16-le", _codecs.BOM_UTF16_BE: "utf-16-be"}),
+)
+# First bytes of all BOMs above; lets BOM-less data skip the lookups.
+_BOM_LEAD_BYTES = frozenset(
+    bom[:1] for _, boms in _BOM_ENCODINGS_BY_LENGTH for bom in boms
+)
 
 
 def _decode_bytes(data: bytes, encoding: str | None, errors: str) -> str:
@@ -305,15 +323,43 @@ def _decode_bytes(data: bytes, encoding: str | None, errors: str) -> str:
         return data.decode(encoding, errors)
 
     # Try to detect encoding using BOM (check longer BOMs first)
-
-    for bom, enc in _BOM_ENCODINGS:
-        if data.startswith(bom):
-            return data.decode(enc, errors)
+    if data[:1] in _BOM_LEAD_BYTES:
+        for length, boms in _BOM_ENCODINGS_BY_LENGTH:
+            enc = boms.get(data[:length])
+            if enc is not None:
+                return data.decode(enc, errors)
 
     # Fallback to UTF-8
     return data.decode("utf-8", errors)
 
 
+class _FilePathParents(_Sequence[_FilePathT]):
+    """Lazy sequence of a `FilePath`'s logical parents (see `FilePath.parents`)."""
+
+    __slots__ = ("_file_path", "_parents")
+
+    def __init__(self, file_path: _FilePathT) -> None:
+        self._file_path = file_path
+        self._parents = file_path.path.parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    @_overload
+    def __getitem__(self, index: int) -> _FilePathT: ...
+
+    @_overload
+    def __getitem__(self, index: slice) -> tuple[_FilePathT, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> _FilePathT | tuple[_FilePathT, ...]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        return self._file_path._with_path(self._parents[index])
+
+    def __repr__(self) -> str:
+        return f"<{self._file_path!r}.parents>"
+
+
 class FilePath(_Generic[ResolvedPathT]):
     """
     Base class for file paths with stable base directory support for memoization.
@@ -335,10 +381,16 @@ class FilePath(_Generic[ResolvedPathT]):
         ResolvedPathT: The type of the resolved path (e.g., `pathlib.Path` for local filesystem).
     """
 
-    __slots__ = ("_base_dir", "_path")
+    __slots__ = ("_base_dir", "_base_dir_key", "_path", "_hash", "_memo_key")
 
     _base_dir: _ContextKey[ResolvedPathT] | None
+    # `_base_dir.key`, kept alongside for comparisons and hashing.
+    _base_dir_key: str | None
     _path: _PurePath
+    # Lazily computed; FilePath is immutable, and these are hit on every
+    # dict/set lookup and memo key computation.
+    _hash: int | None
+    _memo_key: object
 
     def __init__(
         self,
@@ -346,7 +398,24 @@ class FilePath(_Generic[ResolvedPathT]):
         path: _PurePath,
     ) -> None:
         self._base_dir = base_dir
+        self._base_dir_key = base_dir.key if base_dir is not None else None
         self._path = path
+        self._hash = None
+        self._memo_key = None
+
+    def __getstate__(self) -> tuple[None, dict[str, _Any]]:
+        # Don't carry cached values across processes: str hashes are salted
+        # per process.
+        _, slots = _cast(tuple[None, dict[str, _Any]], super().__getstate__())
+        slots.pop("_hash", None)
+        slots.pop("_memo_key", None)
+        return (None, slots)
+
+    def __setstate__(self, state: tuple[None, dict[str, _Any]]) -> None:
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._hash = None
+        self._memo_key = None
 
     @property
     def base_dir(self) -> _ContextKey[ResolvedPathT] | None:
@@ -382,9 +451,13 @@ class FilePath(_Generic[ResolvedPathT]):
         return self._with_path(self._path.parent)
 
     @property
-    def parents(self) -> tuple[_Self, ...]:
-        """An immutable sequence of the path's logical parents."""
-        return tuple(self._with_path(p) for p in self._path.parents)
+    def parents(self) -> _Sequence[_Self]:
+        """An immutable sequence of the path's logical parents.
+
+        Like ``pathlib``'s, parents are created on access, so looking at the
+        nearest few doesn't build all of them.
+        """
+        return _FilePathParents(self)
 
     @property
     def name(self) -> str:
@@ -467,24 +540,22 @@ class FilePath(_Generic[ResolvedPathT]):
 
     # Comparison and hashing
 
-    def _base_dir_key(self) -> str | None:
-        return self._base_dir.key if self._base_dir is not None else None
-
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FilePath):
             return NotImplemented
-        return (
-            self._base_dir_key() == other._base_dir_key() and self._path == other._path
-        )
+        return self._base_dir_key == other._base_dir_key and self._path == other._path
 
     def __hash__(self) -> int:
-        return hash((self._base_dir_key(), self._path))
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self._base_dir_key, self._path))
+        return h
 
     def __lt__(self, other: _Self) -> bool:
         if not isinstance(other, FilePath):
             return NotImplemented
-        sk_self = self._base_dir_key()
-        sk_other = other._base_dir_key()
+        sk_self = self._base_dir_key
+        sk_other = other._base_dir_key
         if sk_self != sk_other:
             if sk_self is None:
                 return True
@@ -507,6 +578,11 @@ class FilePath(_Generic[ResolvedPathT]):
     # Memoization support
 
     def __coco_memo_key__(self) -> object:
-        if self._base_dir is not None:
-            return (self._base_dir.key, self._path)
-        return self._path
+        key = self._memo_key
+        if key is None:
+            if self._base_dir_key is not None:
+                key = (self._base_dir_key, self._path)
+            else:
+                key = self._path
+            self._memo_key = key
+        return key
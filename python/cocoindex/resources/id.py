@@ -86,6 +86,16 @@ def generate_uuid(_dep: _typing.Any = None) -> _uuid.UUID:
     return _uuid.uuid4()
 
 
+# `dep` defaults to None, so its fingerprint is by far the most common one.
+_NONE_FP = _memo_fingerprint.memo_fingerprint(None).as_bytes()
+
+
+def _dep_fingerprint(dep: _typing.Any) -> bytes:
+    if dep is None:
+        return _NONE_FP
+    return _memo_fingerprint.memo_fingerprint(dep).as_bytes()
+
+
 class IdGenerator(_coco.NotMemoKeyable):
     """
     Generator for stable unique IDs that produces distinct IDs on each call.
@@ -139,7 +149,7 @@ class IdGenerator(_coco.NotMemoKeyable):
             A unique integer ID (IDs start from 1; 0 is reserved).
         """
         # Get fingerprint bytes for dep
-        dep_fp = bytes(_memo_fingerprint.memo_fingerprint(dep))
+        dep_fp = _dep_fingerprint(dep)
 
         # Get and increment ordinal for this fingerprint
         ordinal = self._ordinals.get(dep_fp, 0)
@@ -184,7 +194,7 @@ class UuidGenerator(_coco.NotMemoKeyable):
     _ordinals: dict[bytes, int]
 
     def __init__(self, deps: _typing.Any = None) -> None:
-        self._deps_fp = bytes(_memo_fingerprint.memo_fingerprint(deps))
+        self._deps_fp = _memo_fingerprint.memo_fingerprint(deps).as_bytes()
         self._ordinals = {}
 
     def next_uuid(self, dep: _typing.Any = None) -> _uuid.UUID:
@@ -203,7 +213,7 @@ class UuidGenerator(_coco.NotMemoKeyable):
             A unique UUID.
         """
         # Get fingerprint bytes for dep
-        dep_fp = _memo_fingerprint.memo_fingerprint(dep).as_bytes()
+        dep_fp = _dep_fingerprint(dep)
 
         # Get and increment ordinal for this fingerprint
         ordinal = self._ordinals.get(dep_fp, 0)
@@ -55,6 +55,36 @@ def test_localfs_filepath_with_base_dir_memo_key() -> None:
     )
 
 
+def test_localfs_filepath_pickle_drops_cached_hash() -> None:
+    """Cached hash / memo key are recomputed after unpickling, not carried over."""
+    import pickle
+
+    fp = LocalfsFilePath("dir/file.txt")
+    hash(fp)
+    fp.__coco_memo_key__()
+    restored = pickle.loads(pickle.dumps(fp))
+    assert restored._hash is None
+    assert restored._memo_key is None
+    assert restored == fp
+    assert hash(restored) == hash(fp)
+    assert restored.__coco_memo_key__() == PurePath("dir/file.txt")
+
+
+def test_localfs_filepath_parents() -> None:
+    """parents is a lazy sequence of FilePaths mirroring PurePath.parents."""
+    fp = LocalfsFilePath("a/b/c.txt")
+    parents = fp.parents
+    assert len(parents) == 3
+    assert parents[0] == LocalfsFilePath("a/b")
+    assert parents[-1] == LocalfsFilePath(".")
+    assert list(parents) == [
+        LocalfsFilePath("a/b"),
+        LocalfsFilePath("a"),
+        LocalfsFilePath("."),
+    ]
+    assert parents[:2] == (LocalfsFilePath("a/b"), LocalfsFilePath("a"))
+
+
 def test_localfs_has_no_register_base_dir() -> None:
     """localfs no longer exports register_base_dir."""
     import cocoindex.connectors.localfs as localfs
@@ -1,6 +1,8 @@
 import dataclasses
+import inspect
+import types
 from collections.abc import Mapping, Sequence
-from typing import Annotated, Any, NamedTuple
+from typing import Annotated, Any, NamedTuple, Union, get_args
 
 import numpy as np
 from numpy.typing import NDArray
@@ -11,6 +13,7 @@ from cocoindex._internal.datatype import (
     RecordType,
     LeafType,
     DataTypeInfo,
+    UnionType,
     analyze_type_info,
 )
 
@@ -274,3 +277,76 @@ def test_type_with_attributes() -> None:
         annotations=("Annotation1", "Annotation2"),
         nullable=False,
     )
+
+
+@dataclasses.dataclass
+class DataclassWithDefaults:
+    name: str
+    value: int = 1
+    computed: int = dataclasses.field(default=0, init=False)
+
+
+def test_dataclass_record_fields() -> None:
+    fields = list(RecordType(record_type=DataclassWithDefaults).fields)
+    assert [(f.name, f.type_hint, f.default_value) for f in fields] == [
+        ("name", str, inspect.Parameter.empty),
+        ("value", int, 1),
+    ]
+
+
+@dataclasses.dataclass
+class DataclassWithCustomInit:
+    x: int
+    y: int = 0
+
+    def __init__(self, x: int, z: int = 5) -> None:
+        self.x = x
+        self.y = z
+
+
+def test_dataclass_record_fields_custom_init() -> None:
+    fields = list(RecordType(record_type=DataclassWithCustomInit).fields)
+    assert [(f.name, f.default_value) for f in fields] == [
+        ("x", inspect.Parameter.empty),
+        ("z", 5),
+    ]
+
+
+@dataclasses.dataclass
+class DataclassWithKwOnly:
+    a: int = dataclasses.field(default=0, kw_only=True)
+    b: str = ""
+    c: float = 0.0
+
+
+def test_dataclass_record_fields_kw_only() -> None:
+    fields = list(RecordType(record_type=DataclassWithKwOnly).fields)
+    assert [f.name for f in fields] == ["b", "c", "a"]
+
+
+def test_type_with_unhashable_attributes() -> None:
+    typ = Annotated[int, ["unhashable"]]
+    result = analyze_type_info(typ)
+    assert result.core_type is int
+    assert result.annotations == (["unhashable"],)
+    assert analyze_type_info(typ) == result
+
+
+def test_union_variant_order_is_preserved() -> None:
+    # `int | str == str | int`, but each keeps its own variant order.
+    assert analyze_type_info(int | str).variant == UnionType(variant_types=(int, str))
+    assert analyze_type_info(str | int).variant == UnionType(variant_types=(str, int))
+    for elem_type in (int | str, str | int):
+        variant = analyze_type_info(list[elem_type]).variant  # type: ignore[valid-type]
+        assert isinstance(variant, SequenceType)
+        assert get_args(variant.elem_type) == get_args(elem_type)
+
+
+def test_union_spelling_is_preserved() -> None:
+    # `int | str == Union[int, str]`, but each keeps its own base type.
+    assert analyze_type_info(int | str).base_type is types.UnionType
+    assert analyze_type_info(Union[int, str]).base_type is Union
+    for elem_type in (int | str, Union[int, str]):
+        variant = analyze_type_info(list[elem_type]).variant  # type: ignore[valid-type]
+        assert isinstance(variant, SequenceType)
+        assert type(variant.elem_type) is type(elem_type)
@@ -0,0 +1,47 @@
+"""Tests for the event loops CocoIndex creates for its own loop threads."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from cocoindex._internal.environment import _new_event_loop
+
+
+def _install_fake_uvloop(monkeypatch: pytest.MonkeyPatch) -> type:
+    class _FakeUvloopLoop(asyncio.SelectorEventLoop):
+        pass
+
+    module = types.ModuleType("uvloop")
+    module.new_event_loop = _FakeUvloopLoop  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", module)
+    return _FakeUvloopLoop
+
+
+def test_uvloop_not_used_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An installed uvloop isn't picked up without opting in."""
+    fake_loop_type = _install_fake_uvloop(monkeypatch)
+    monkeypatch.delenv("COCOINDEX_USE_UVLOOP", raising=False)
+    loop = _new_event_loop()
+    try:
+        assert not isinstance(loop, fake_loop_type)
+    finally:
+        loop.close()
+
+
+def test_uvloop_used_when_opted_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_loop_type = _install_fake_uvloop(monkeypatch)
+    monkeypatch.setenv("COCOINDEX_USE_UVLOOP", "1")
+    loop = _new_event_loop()
+    try:
+        assert isinstance(loop, fake_loop_type)
+    finally:
+        loop.close()
+
+
+def test_uvloop_opt_in_requires_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    monkeypatch.setenv("COCOINDEX_USE_UVLOOP", "1")
+    with pytest.raises(ImportError, match="cocoindex\\[uvloop\\]"):
+        _new_event_loop()
@@ -1,7 +1,7 @@
 """Tests for TypeChecker runtime type validation."""
 
 import uuid
-from typing import Any
+from typing import Any, Protocol, TypedDict
 
 import pytest
 
@@ -75,6 +75,35 @@ class TestUnionTypes:
         with pytest.raises(TypeError):
             checker.check(42)
 
+    def test_union_with_generic_variant(self) -> None:
+        checker: TypeChecker[str | tuple[str, int]] = TypeChecker(
+            str | tuple[str, int]  # type: ignore[arg-type]
+        )
+        assert checker.check("hello") == "hello"
+        assert checker.check(("a", 1)) == ("a", 1)
+        with pytest.raises(TypeError, match="got tuple"):
+            checker.check(("a", "b"))
+
+    def test_union_with_any_accepts_anything(self) -> None:
+        checker: TypeChecker[str | Any] = TypeChecker(str | Any)  # type: ignore[arg-type]
+        assert checker.check("hello") == "hello"
+        assert checker.check(42) == 42
+        assert checker.check(None) is None
+
+    def test_union_with_protocol_variant(self) -> None:
+        class HasName(Protocol):
+            name: str
+
+        checker: TypeChecker[int | HasName] = TypeChecker(int | HasName)  # type: ignore[arg-type]
+        assert checker.check(1) == 1
+
+    def test_union_with_typeddict_variant(self) -> None:
+        class Point(TypedDict):
+            x: int
+
+        checker: TypeChecker[Point | int] = TypeChecker(Point | int)  # type: ignore[arg-type]
+        assert checker.check(5) == 5
+
 
 # ---------------------------------------------------------------------------
 # Fixed-length tuple types
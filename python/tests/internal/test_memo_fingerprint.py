@@ -6,6 +6,7 @@ import pytest
 
 from cocoindex._internal.function import _apply_memo_key, _normalize_memo_key
 from cocoindex._internal.memo_fingerprint import (
+    _canonicalize,
     fingerprint_call,
     register_memo_key_function,
     unregister_memo_key_function,
@@ -780,3 +781,14 @@ def test_fingerprint_dict_and_set_with_fingerprint_keys_order_independent() -> N
     nested1 = {"items": [{fp1: 1, fp2: 2}]}
     nested2 = {"items": [{fp2: 2, fp1: 1}]}
     assert memo_fingerprint(nested1) == memo_fingerprint(nested2)
+
+
+def test_sequence_of_primitives_canonical_form() -> None:
+    assert _canonicalize([1, 2.5, "a", None, b"x", True], None, []) == (
+        "seq",
+        (1, 2.5, "a", None, b"x", True),
+    )
+    assert _canonicalize([[1, 2], (3,)], None, []) == (
+        "seq",
+        (("seq", (1, 2)), ("seq", (3,))),
+    )
@@ -282,3 +282,47 @@ async def test_litellm_embedder_does_not_retry_missing_credentials_server_error(
 
     mocked_embedding.assert_awaited_once()
     sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "model, kwargs, expected_dim",
+    [
+        ("text-embedding-3-large", {}, 3072),
+        ("openai/text-embedding-3-small", {}, 1536),
+        ("text-embedding-3-large", {"dimensions": 256}, 256),
+    ],
+)
+@pytest.mark.asyncio
+async def test_litellm_embedder_dimension_without_probe(
+    model: str, kwargs: dict[str, Any], expected_dim: int
+) -> None:
+    embedder = LiteLLMEmbedder(model, **kwargs)
+    mocked_embedding = AsyncMock()
+
+    with patch("cocoindex.ops.litellm.litellm.aembedding", new=mocked_embedding):
+        assert await embedder._get_dim() == expected_dim
+
+    mocked_embedding.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "model, kwargs",
+    [
+        # `dimensions` may be dropped by providers that don't support it.
+        ("ollama/nomic-embed-text", {"dimensions": 256}),
+        ("text-embedding-ada-002", {"dimensions": 256}),
+        ("text-embedding-3-large", {"api_base": "http://localhost:8000"}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_litellm_embedder_dimension_probed(
+    model: str, kwargs: dict[str, Any]
+) -> None:
+    fake_response = SimpleNamespace(data=[{"embedding": [0.0] * 768}])
+    embedder = LiteLLMEmbedder(model, **kwargs)
+    mocked_embedding = AsyncMock(return_value=fake_response)
+
+    with patch("cocoindex.ops.litellm.litellm.aembedding", new=mocked_embedding):
+        assert await embedder._get_dim() == 768
+
+    mocked_embedding.assert_awaited_once()
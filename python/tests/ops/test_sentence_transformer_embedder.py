@@ -9,7 +9,10 @@ classification and the batching engine's RetryWithSmallerBatch path
 from __future__ import annotations
 
 import asyncio
+import pickle
+import sys
 import threading
+import types
 from typing import Any
 
 import numpy as np
@@ -112,3 +115,124 @@ def test_sentence_transformer_non_oom_error_propagates() -> None:
     embedder = _make_embedder(_AlwaysFailModel(KeyError("unknown prompt_name")))
     with pytest.raises(KeyError):
         embedder._embed._execute_orig_sync_fn(["a", "b"])
+
+
+def test_sentence_transformer_precision_is_part_of_identity() -> None:
+    """Precision changes the numbers, so it survives pickling and is part of
+    the memo key; unknown values are rejected up front."""
+    fp16 = SentenceTransformerEmbedder("fake-model", precision="float16")
+    restored = pickle.loads(pickle.dumps(fp16))
+    assert restored.__coco_memo_key__() == fp16.__coco_memo_key__()
+    assert (
+        fp16.__coco_memo_key__()
+        != SentenceTransformerEmbedder("fake-model").__coco_memo_key__()
+    )
+
+    # Default precision keeps the key memos were recorded under before the
+    # option existed.
+    assert SentenceTransformerEmbedder("fake-model").__coco_memo_key__() == (
+        "fake-model",
+        None,
+        False,
+    )
+
+    with pytest.raises(ValueError, match="precision"):
+        SentenceTransformerEmbedder("fake-model", precision="int8")  # type: ignore[arg-type]
+
+
+class _FakeSentenceTransformer:
+    """Stands in for ``sentence_transformers.SentenceTransformer`` in ``_load_model``."""
+
+    def __init__(
+        self,
+        model_name_or_path: str,
+        *,
+        device: str | None = None,
+        trust_remote_code: bool = False,
+    ) -> None:
+        self.model_name_or_path = model_name_or_path
+        self.device = types.SimpleNamespace(type=device or "cpu")
+        self.tokenizer = types.SimpleNamespace(is_fast=True)
+        self.max_seq_length = 512
+        self.dtype = "float32"
+
+    def half(self) -> None:
+        self.dtype = "float16"
+
+    def bfloat16(self) -> None:
+        self.dtype = "bfloat16"
+
+
+@pytest.fixture
+def fake_sentence_transformers(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = _FakeSentenceTransformer  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+
+def test_sentence_transformer_max_seq_length_is_part_of_identity() -> None:
+    """``max_seq_length`` survives pickling and keys memos only when set."""
+    default = SentenceTransformerEmbedder("fake-model")
+    short = SentenceTransformerEmbedder("fake-model", max_seq_length=128)
+
+    restored = pickle.loads(pickle.dumps(short))
+    assert restored._max_seq_length == 128
+    assert restored.__coco_memo_key__() == short.__coco_memo_key__()
+    assert short.__coco_memo_key__() == (*default.__coco_memo_key__(), 128)  # type: ignore[misc]
+
+    for invalid in (0, -1, 1.5, True):
+        with pytest.raises(ValueError, match="max_seq_length"):
+            SentenceTransformerEmbedder("fake-model", max_seq_length=invalid)  # type: ignore[arg-type]
+
+
+@pytest.mark.usefixtures("fake_sentence_transformers")
+def test_sentence_transformer_max_seq_length_applied_on_load() -> None:
+    short = SentenceTransformerEmbedder("fake-model", max_seq_length=128)
+    default = SentenceTransformerEmbedder("fake-model")
+    assert short._get_model().max_seq_length == 128
+    assert default._get_model().max_seq_length == 512
+
+
+@pytest.mark.usefixtures("fake_sentence_transformers")
+def test_sentence_transformer_models_shared_by_configuration() -> None:
+    """Embedders configured the same way share one loaded model; any
+    difference in configuration loads its own."""
+    first = SentenceTransformerEmbedder("fake-model", device="cuda")
+    second = SentenceTransformerEmbedder("fake-model", device="cuda")
+    fp16 = SentenceTransformerEmbedder("fake-model", device="cuda", precision="float16")
+
+    model = first._get_model()
+    assert second._get_model() is model
+    assert fp16._get_model() is not model
+    assert model.dtype == "float32"  # type: ignore[attr-defined]
+    assert fp16._get_model().dtype == "float16"  # type: ignore[attr-defined]
+
+
+def test_sentence_transformer_slow_load_does_not_block_other_models(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    class _BlockingSentenceTransformer(_FakeSentenceTransformer):
+        def __init__(self, model_name_or_path: str, **kwargs: Any) -> None:
+            if model_name_or_path == "slow-model":
+                started.set()
+                assert release.wait(timeout=5)
+            super().__init__(model_name_or_path, **kwargs)
+
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = _BlockingSentenceTransformer  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+    slow = SentenceTransformerEmbedder("slow-model")
+    loader = threading.Thread(target=slow._get_model)
+    loader.start()
+    try:
+        assert started.wait(timeout=5)
+        fast = SentenceTransformerEmbedder("fast-model")
+        assert fast._get_model().model_name_or_path == "fast-model"  # type: ignore[attr-defined]
+    finally:
+        release.set()
+        loader.join(timeout=5)
+    assert slow._get_model().model_name_or_path == "slow-model"  # type: ignore[attr-defined]
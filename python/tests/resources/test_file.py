@@ -0,0 +1,76 @@
+"""Tests for FileLike content caching across memo state validation."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import PurePath
+from typing import Self
+
+import pytest
+
+from cocoindex.connectorkits.fingerprint import fingerprint_bytes
+from cocoindex.resources.file import FileLike, FileMetadata, FilePath
+
+_MTIME = datetime(2026, 1, 1)
+_CONTENT = b"hello, world"
+
+
+class _MemFilePath(FilePath[PurePath]):
+    def resolve(self) -> PurePath:
+        return self._path
+
+    def _with_path(self, path: PurePath) -> Self:
+        return type(self)(None, path)
+
+
+class _MemFile(FileLike[PurePath]):
+    """In-memory file that counts full reads from the "backend"."""
+
+    def __init__(self, content: bytes, modified_time: datetime) -> None:
+        super().__init__(_MemFilePath(None, PurePath("a.txt")))
+        self._content = content
+        self._modified_time = modified_time
+        self.num_reads = 0
+
+    async def _fetch_metadata(self) -> FileMetadata:
+        return FileMetadata(size=len(self._content), modified_time=self._modified_time)
+
+    async def _read_impl(self, size: int = -1) -> bytes:
+        self.num_reads += 1
+        return self._content if size < 0 else self._content[:size]
+
+
+# Same content as recorded, but touched since: the fingerprint has to be recomputed.
+_PREV_STATE = (_MTIME - timedelta(seconds=1), fingerprint_bytes(_CONTENT))
+
+
+@pytest.mark.asyncio
+async def test_memo_state_releases_content_read_only_for_fingerprint() -> None:
+    file = _MemFile(_CONTENT, _MTIME)
+    outcome = await file.__coco_memo_state__(_PREV_STATE)
+    assert outcome.memo_valid
+    assert file._cached_content is None
+    # Still readable; it's just fetched again.
+    assert await file.read() == _CONTENT
+    assert file.num_reads == 2
+
+
+@pytest.mark.asyncio
+async def test_memo_state_keeps_content_read_before() -> None:
+    file = _MemFile(_CONTENT, _MTIME)
+    assert await file.read() == _CONTENT
+    outcome = await file.__coco_memo_state__(_PREV_STATE)
+    assert outcome.memo_valid
+    assert file._cached_content == _CONTENT
+    assert await file.read() == _CONTENT
+    assert file.num_reads == 1
+
+
+@pytest.mark.asyncio
+async def test_memo_state_keeps_content_when_changed() -> None:
+    """A changed file is about to be processed, so its content stays cached."""
+    file = _MemFile(b"new content", _MTIME)
+    outcome = await file.__coco_memo_state__(_PREV_STATE)
+    assert not outcome.memo_valid
+    assert await file.read() == b"new content"
+    assert file.num_reads == 1